@@ -7,8 +7,15 @@ transport, no orchestration:
 * one :class:`~ef.service.EfService` is constructed per process; it holds the
   live ``{corpus_id: SourceManager}`` registry,
 * its seven JSON-friendly methods are handed to :func:`qh.mk_app`, which derives
-  the HTTP routes, request schema and OpenAPI spec from their type hints,
-* CORS is enabled so the browser frontend can call the API.
+  the HTTP routes, request schema and OpenAPI spec from their type hints — each
+  wrapped by :func:`_offloaded` so the blocking ``ef`` call runs in a worker
+  thread, not on the event loop. Service calls therefore run concurrently,
+  except :data:`REGISTRY_METHODS`, which are serialized (a stopgap until
+  ``EfService`` locks its own registry),
+* CORS is enabled so the browser frontend can call the API,
+* responses over :data:`GZIP_MINIMUM_SIZE` bytes are gzip-compressed — the
+  large ones (``explore_corpus`` coordinates, long ``search`` hit lists) are
+  repetitive JSON that shrinks several-fold on the wire.
 
 No persistence and no auth this round: corpora are in-memory and per-process —
 a server restart drops them.
@@ -29,12 +36,16 @@ they are never ``pip install``ed.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import warnings
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from ef.service import EfService
 from qh import mk_app
@@ -50,6 +61,15 @@ DEFAULT_CORS_ORIGINS: tuple[str, ...] = (
 #: Env var holding a comma-separated CORS origin allowlist (overrides the default).
 CORS_ORIGINS_ENVVAR = "APP_EF_CORS_ORIGINS"
 
+#: Responses smaller than this many bytes are sent uncompressed — below it,
+#: gzip's CPU and header overhead outweighs the bytes saved.
+GZIP_MINIMUM_SIZE = 1024
+
+#: gzip level (1-9) for those responses — 5 trades CPU for ratio: on
+#: repetitive float JSON it gets close to level 9's size at a fraction of the
+#: CPU per response.
+GZIP_COMPRESS_LEVEL = 5
+
 #: Env var naming the embedder new corpora use when the request names none —
 #: an explicit operator override, any string ``ef``'s DI seam resolves.
 EMBEDDER_ENVVAR = "APP_EF_EMBEDDER"
@@ -75,6 +95,15 @@ SERVICE_METHODS: tuple[str, ...] = (
     "delete_corpus",
 )
 
+#: The :data:`SERVICE_METHODS` serialized against each other, because
+#: ``EfService``'s corpus registry is not thread-safe: without this, two
+#: concurrent same-id ``create_corpus`` calls can both succeed. A stopgap — the
+#: lock belongs in ``EfService`` (tracked in ``misc/docs/app_ef_notes.md`` §7);
+#: drop this once ``ef`` provides it.
+REGISTRY_METHODS: frozenset[str] = frozenset(
+    {"create_corpus", "list_corpora", "delete_corpus"}
+)
+
 
 def _env_cors_origins() -> tuple[str, ...] | None:
     """Parse the CORS allowlist from the environment, or ``None`` if unset."""
@@ -119,6 +148,34 @@ def _resolve_default_embedder() -> str:
     return FALLBACK_EMBEDDER
 
 
+def _offloaded(
+    method: Callable[..., Any], *, lock: asyncio.Lock | None = None
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap a blocking :class:`~ef.service.EfService` method to run in a thread.
+
+    ``qh`` calls a plain function straight from its ``async`` endpoint — on the
+    event loop — so an ``EfService`` call that embeds (``create_corpus``,
+    ``search``, …: seconds with a hosted model embedder) would stall every
+    other request, ``/health`` included. ``qh`` *awaits* coroutine functions,
+    so this coroutine hands the call to :func:`asyncio.to_thread` instead.
+    :func:`functools.wraps` keeps the name, docstring, signature and type hints
+    ``qh`` derives the route and OpenAPI schema from.
+
+    ``lock``, if given, is held around the call — awaited on the event loop,
+    so callers queued behind it hold no worker thread. :func:`build_app` passes
+    one shared lock for the :data:`REGISTRY_METHODS`.
+    """
+
+    @functools.wraps(method)
+    async def offloaded(*args: Any, **kwargs: Any) -> Any:
+        if lock is None:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        async with lock:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    return offloaded
+
+
 def build_app(
     service: EfService | None = None,
     *,
@@ -143,8 +200,8 @@ def build_app(
 
     Returns:
         a :class:`~fastapi.FastAPI` app exposing the seven ``EfService``
-        endpoints, with CORS, a ``/health`` check and the ``qh``-generated
-        ``/docs`` + ``/openapi.json``.
+        endpoints, with CORS, gzip compression, a ``/health`` check and the
+        ``qh``-generated ``/docs`` + ``/openapi.json``.
     """
     if service is None:
         embedder = (
@@ -171,13 +228,25 @@ def build_app(
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    base.add_middleware(
+        GZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL,
+    )
 
     @base.get("/health", tags=["ops"])
     def health() -> dict[str, str]:
         """Liveness probe — used by the Docker healthcheck."""
         return {"status": "ok"}
 
-    methods = [getattr(service, name) for name in SERVICE_METHODS]
+    registry_lock = asyncio.Lock()
+    methods = [
+        _offloaded(
+            getattr(service, name),
+            lock=registry_lock if name in REGISTRY_METHODS else None,
+        )
+        for name in SERVICE_METHODS
+    ]
     return mk_app(methods, app=base)
 
 
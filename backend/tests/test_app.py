@@ -2,16 +2,22 @@
 
 The backend is pure transport over :class:`ef.service.EfService`, so these
 tests verify the *wiring* — the seven service methods are reachable, responses
-serialize (notably ``search``, whose ``SearchHit`` is a dataclass), CORS is
-applied, and the ``EfService`` is injectable — not the embedding/search logic
-itself (that is tested in ``ef``).
+serialize (notably ``search``, whose ``SearchHit`` is a dataclass), CORS and
+gzip are applied, and the ``EfService`` is injectable — not the embedding/search
+logic itself (that is tested in ``ef``).
 """
 
+import asyncio
+import functools
+import time
+
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from ef.service import EfService
+from ef.source_manager import SourceManager
 
 from app.main import (
     FALLBACK_EMBEDDER,
@@ -37,6 +43,18 @@ def _client(**build_kwargs) -> TestClient:
     return TestClient(build_app(**build_kwargs))
 
 
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """One default-configured client shared by the tests that never mutate it.
+
+    Building the app runs ``qh``'s route derivation, so stateless tests reuse
+    this instance. Tests that create or delete corpora, or need non-default
+    build arguments, build their own via :func:`_client` so the registry they
+    assert on starts empty.
+    """
+    return _client()
+
+
 def test_build_app_exposes_all_service_routes():
     """build_app() wires every EfService method plus the /health probe."""
     app = build_app()
@@ -51,9 +69,9 @@ def test_build_app_exposes_all_service_routes():
     assert "/docs" in paths
 
 
-def test_health():
+def test_health(client):
     """The liveness probe returns a plain ok status."""
-    response = _client().get("/health")
+    response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
@@ -110,9 +128,9 @@ def test_explore_corpus():
     assert len(result["ids"]) == len(result["coords"]) == len(result["labels"])
 
 
-def test_cors_header_present_for_default_origin():
+def test_cors_header_present_for_default_origin(client):
     """A request from a default frontend origin gets the CORS allow header."""
-    response = _client().get(
+    response = client.get(
         "/health", headers={"Origin": "http://localhost:5173"}
     )
     assert response.headers.get("access-control-allow-origin") == (
@@ -136,6 +154,76 @@ def test_cors_origins_are_configurable():
     assert "access-control-allow-origin" not in rejected.headers
 
 
+def test_service_calls_run_off_the_event_loop():
+    """A blocking EfService call runs in a worker thread, not on the loop."""
+    service = EfService()
+    loop_running_in_call = []
+
+    @functools.wraps(service.list_corpora)
+    def list_corpora():
+        try:
+            asyncio.get_running_loop()
+            loop_running_in_call.append(True)
+        except RuntimeError:
+            loop_running_in_call.append(False)
+        return []
+
+    service.list_corpora = list_corpora
+    response = TestClient(build_app(service=service)).post("/list_corpora", json={})
+    assert response.status_code == 200
+    assert loop_running_in_call == [False]
+
+
+def test_concurrent_same_id_create_corpus_rejects_the_duplicate(monkeypatch):
+    """Two simultaneous create_corpus calls for one id: exactly one succeeds.
+
+    With service calls offloaded to worker threads, ``create_corpus``'s
+    check-then-insert on the registry must not interleave — else the second
+    index silently replaces the first. A slowed ``materialize`` widens the gap.
+    """
+    materialize = SourceManager.materialize
+
+    def slow_materialize(self, *args, **kwargs):
+        time.sleep(0.3)
+        return materialize(self, *args, **kwargs)
+
+    monkeypatch.setattr(SourceManager, "materialize", slow_materialize)
+    app = build_app(default_embedder="hashing")
+
+    async def create_twice() -> list[int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            body = {"sources": SOURCES, "corpus_id": "x"}
+            responses = await asyncio.gather(
+                client.post("/create_corpus", json=body),
+                client.post("/create_corpus", json=body),
+            )
+        return sorted(r.status_code for r in responses)
+
+    assert asyncio.run(create_twice()) == [200, 500]
+
+
+def test_large_responses_are_gzipped():
+    """Payloads over GZIP_MINIMUM_SIZE are compressed; small ones are not."""
+    client = _client()
+    sources = [f"document number {i} about cats and dogs" for i in range(50)]
+    client.post("/create_corpus", json={"sources": sources, "corpus_id": "big"})
+
+    found = client.post(
+        "/search",
+        json={"corpus_id": "big", "query": "cats", "limit": 50},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert found.status_code == 200
+    assert found.headers.get("content-encoding") == "gzip"
+    assert len(found.json()) == 50  # httpx decompresses transparently
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
 def test_service_is_injectable():
     """A pre-seeded EfService can be injected — the registry is on the instance."""
     service = EfService()  # no args → the offline hashing default